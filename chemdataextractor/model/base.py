@@ -11,11 +11,11 @@ from __future__ import unicode_literals
 
 import copy
 from abc import ABCMeta
-from collections import MutableSequence
 import json
 import logging
 import math
 from pprint import pprint
+import sys
 
 import six
 
@@ -27,6 +27,9 @@ from .contextual_range import DocumentRange, SentenceRange
 
 log = logging.getLogger(__name__)
 
+# Defaults of these types are returned unchanged by copy.copy, so there is no need to copy them
+_IMMUTABLE_DEFAULT_TYPES = (type(None), six.text_type, six.binary_type, bool, int, float, tuple, frozenset)
+
 
 class BaseType(six.with_metaclass(ABCMeta)):
 
@@ -178,6 +181,9 @@ class ListType(BaseType):
         self.field = field
         self.default = default if default is not None else []
         self.sorted = sorted_
+        # Processed strings and floats are already primitive, so serializing them is a no-op
+        self._identity_serialize = (type(field).serialize is BaseType.serialize
+                                    and type(field).process in (StringType.process, FloatType.process))
 
     def __set__(self, instance, value):
         """Descriptor for assigning a value to a ListField in a Model."""
@@ -193,6 +199,8 @@ class ListType(BaseType):
     def serialize(self, value, primitive=False):
         """Serialize this field."""
         if value:
+            if self._identity_serialize:
+                return list(value)
             return [self.field.serialize(v, primitive=primitive) for v in value]
         else:
             return None
@@ -295,7 +303,25 @@ class ModelMeta(ABCMeta):
     """"""
 
     def __new__(mcs, name, bases, attrs):
+        # Parsers set on the class are only kept as the source for the copies made by ModelMeta.parsers,
+        # so that they are never found in place of those copies, e.g. when accessed from an instance
+        parser_sources = None
+        if 'parsers' in attrs and not isinstance(attrs['parsers'], property):
+            attrs = dict(attrs)
+            parser_sources = attrs.pop('parsers')
         cls = super(ModelMeta, mcs).__new__(mcs, name, bases, attrs)
+        if parser_sources is None:
+            # Inherit the parsers the nearest base has at this point, including any added to its
+            # copies since they were made, as if they were copied now
+            for base in cls.__mro__[1:]:
+                if '_parsers' in base.__dict__:
+                    parser_sources = list(base.__dict__['_parsers'])
+                    break
+                if '_parser_sources' in base.__dict__:
+                    parser_sources = list(base.__dict__['_parser_sources'])
+                    break
+        if parser_sources is not None:
+            cls._parser_sources = parser_sources
         fields = {}
         for base in bases:
             for field_name, field in six.iteritems(base.fields):
@@ -303,23 +329,51 @@ class ModelMeta(ABCMeta):
         for attr_name, attr_value in six.iteritems(attrs):
             if isinstance(attr_value, BaseType):
                 # Set the name attribute on the Type to the attribute name on the Model
-                attr_value.name = six.text_type(attr_name)
+                # Interned as it is used as the key into _values whenever the field is accessed
+                attr_value.name = sys.intern(six.text_type(attr_name))
                 fields[attr_name] = attr_value
         cls.fields = fields
-        parsers = []
-        for parser in cls.parsers:
-            p = copy.copy(parser)
-            p.model = cls
-            parsers.append(p)
-        cls.parsers = parsers
+        cls._cache_fields()
         return cls
 
     def __setattr__(cls, key, value):
         if isinstance(value, BaseType):
-            value.name = six.text_type(key)
+            value.name = sys.intern(six.text_type(key))
             cls.fields[key] = value
+            cls._cache_fields()
         return super(ModelMeta, cls).__setattr__(key, value)
 
+    def _cache_fields(cls):
+        """
+        Flatten the fields dictionary into tuples so that the per-instance hot paths
+        (construction, serialization, iteration) don't have to walk the dictionary.
+        """
+        cls._field_items = tuple(cls.fields.items())
+        cls._field_names = tuple(cls.fields.keys())
+        for field in cls.fields.values():
+            field._needs_copy = not isinstance(field.default, _IMMUTABLE_DEFAULT_TYPES)
+
+    @property
+    def parsers(cls):
+        """
+        The parsers for this model. These are copies of the parsers defined on the class, or
+        on the closest base class that defines them, and are made the first time they're needed.
+        """
+        parsers = cls.__dict__.get('_parsers')
+        if parsers is None:
+            parsers = []
+            for parser in cls._parser_sources:
+                p = copy.copy(parser)
+                p.model = cls
+                parsers.append(p)
+            cls._parsers = parsers
+        return parsers
+
+    @parsers.setter
+    def parsers(cls, value):
+        cls._parsers = value
+        cls._parser_sources = value
+
     @property
     def required_fields(cls):
         output = []
@@ -368,7 +422,7 @@ class BaseModel(six.with_metaclass(ModelMeta)):
     """
 
     fields = {}
-    parsers = [AutoSentenceParser(), AutoTableParser()]
+    _parser_sources = [AutoSentenceParser(), AutoTableParser()]
     specifier = None
     _updated = False
 
@@ -379,9 +433,15 @@ class BaseModel(six.with_metaclass(ModelMeta)):
         for key, value in six.iteritems(raw_data):
             setattr(self, key, value)
         # Set defaults
-        for key, field in six.iteritems(self.fields):
+        for key, field in self._field_items:
             if key not in raw_data:
-                setattr(self, key, copy.copy(field.default))
+                if field.default is None:
+                    # Every field type stores None as-is, so skip the descriptor
+                    self._values[key] = None
+                elif field._needs_copy:
+                    setattr(self, key, copy.copy(field.default))
+                else:
+                    setattr(self, key, field.default)
         self._record_method = None
         self.was_updated = self._updated
         # Keep track of the number of times we've merged contextually.
@@ -389,6 +449,13 @@ class BaseModel(six.with_metaclass(ModelMeta)):
         self._contextual_merge_count = 0
         self._no_merge_ranges = {}
 
+    @property
+    def parsers(self):
+        """
+        The parsers for this model's class, see :attr:`ModelMeta.parsers`.
+        """
+        return type(self).parsers
+
     @classmethod
     def deserialize(cls, serialized):
         record = cls()
@@ -529,13 +596,14 @@ class BaseModel(six.with_metaclass(ModelMeta)):
 
     def __eq__(self, other):
         # TODO: Check this actually works as expected (what about default values?)
+        if self is other:
+            return True
         if isinstance(other, self.__class__):
-            log.debug(self._values, other._values)
             return self._values == other._values
         return False
 
     def __iter__(self):
-        return iter(self.fields)
+        return iter(self._field_names)
 
     def __delattr__(self, attr):
         """Handle deletion of field values by setting to default if specified."""
@@ -663,13 +731,13 @@ class BaseModel(six.with_metaclass(ModelMeta)):
         return self.was_updated
 
     def keys(self):
-        return list(iter(self))
+        return list(self._field_names)
 
     def items(self):
-        return [(k, getattr(self, k)) for k in self]
+        return [(k, getattr(self, k)) for k in self._field_names]
 
     def values(self):
-        return [getattr(self, k) for k in self]
+        return [getattr(self, k) for k in self._field_names]
 
     def get(self, key, default=None):
         return getattr(self, key, default)
@@ -683,15 +751,17 @@ class BaseModel(six.with_metaclass(ModelMeta)):
         :rtype: bool
         """
 
-        for field_name, field in six.iteritems(self.fields):
+        for field_name, field in self._field_items:
             if hasattr(field, 'model_class'):
-                if self[field_name] == field.default and field.contextual:
+                # Fetch the value directly instead of going through the keypath lookup in __getitem__
+                value = getattr(self, field_name)
+                if value == field.default and field.contextual:
                     return False
-                if hasattr(self[field_name], 'contextual_fulfilled') and \
-                   not self[field_name].contextual_fulfilled:
+                if hasattr(value, 'contextual_fulfilled') and \
+                   not value.contextual_fulfilled:
                     log.debug('Is contextual')
                     return False
-            elif field.contextual and self[field_name] == field.default:
+            elif field.contextual and getattr(self, field_name) == field.default:
                 log.debug('Is contextual')
                 return False
         log.debug('Not contextual')
@@ -747,14 +817,16 @@ class BaseModel(six.with_metaclass(ModelMeta)):
         """Convert Model to python dictionary."""
         # Serialize fields to a dict
         data = {}
-        for field_name in self:
+        for field_name, field in self._field_items:
             value = getattr(self, field_name)
-            field = self.fields.get(field_name)
+            # Skip empty fields unless field.null, without serializing them first
+            if not field.null and (value is None or value == '' or value == []):
+                continue
             if value is not None:
                 value = field.serialize(value, primitive=primitive)
-            # Skip empty fields unless field.null
-            if not field.null and value in [None, '', []]:
-                continue
+                # Some non-empty values, e.g. empty sets, serialize to empty values
+                if not field.null and (value is None or value == '' or value == []):
+                    continue
             data[field.name] = value
         record = {self.__class__.__name__: data}
         return record
@@ -1291,42 +1363,30 @@ class BaseModel(six.with_metaclass(ModelMeta)):
 
 
 @python_2_unicode_compatible
-class ModelList(MutableSequence):
+class ModelList(list):
     """Wrapper around a list of Models objects to facilitate operations on all at once."""
 
     def __init__(self, *models):
-        self.models = list(models)
+        super(ModelList, self).__init__(models)
 
-    def __getitem__(self, index):
-        return self.models[index]
-
-    def __setitem__(self, index, value):
-        self.models[index] = value
-
-    def __delitem__(self, index):
-        del self.models[index]
+    @property
+    def models(self):
+        """The models in this ModelList. Kept for backwards compatibility, as ModelList is now itself a list."""
+        return self
 
-    def __len__(self):
-        return len(self.models)
+    @models.setter
+    def models(self, value):
+        self[:] = value
 
     def __repr__(self):
-        return self.models.__repr__()
+        return list.__repr__(self)
 
     def __str__(self):
-        return self.models.__str__()
-
-    def __contains__(self, element):
-        log.debug(element.serialize())
-        log.debug(self.serialize())
-        log.debug(self.models.__contains__(element))
-        return self.models.__contains__(element)
-
-    def insert(self, index, value):
-        self.models.insert(index, value)
+        return list.__str__(self)
 
     def serialize(self):
         """Serialize to a list of python dictionaries."""
-        return [e.serialize() for e in self.models]
+        return [e.serialize() for e in self]
 
     def to_json(self, *args, **kwargs):
         """Convert ModelList to JSON."""
@@ -1340,7 +1400,7 @@ class ModelList(MutableSequence):
         """
         # A dictionary with the type of each element as the key, and the element itself as the value
         typed_list = {}
-        for element in self.models:
+        for element in self:
             if type(element) in typed_list:
                 typed_list[type(element)].append(element)
             else:
@@ -1372,20 +1432,20 @@ class ModelList(MutableSequence):
                 if i not in to_remove:
                     new_models.append(elements[i])
                 i += 1
-        self.models = new_models
+        self[:] = new_models
 
     def _remove_used_subrecords(self):
         to_remove = set()
-        for element in self.models:
+        for element in self:
             flattened_instance = element._flatten_instance()
             flattened_instance.remove(element)
             to_remove.update(flattened_instance)
 
         new_models = []
-        for model in self.models:
+        for model in self:
             if model not in to_remove:
                 new_models.append(model)
-        self.models = new_models
+        self[:] = new_models
 
 
 def sort_merge_candidates(merge_candidates, adjust_by_confidence=True):
@@ -7,10 +7,15 @@ Base types for making units. Refer to the example on :ref:`creating new units an
 
 import six
 import copy
+import math
 from abc import abstractmethod
+import numpy as np
 from .dimension import Dimensionless
 from ..base import BaseModel, BaseType, FloatType, StringType, ListType
 
+# The attributes of a unit that are derived from its dimensions, magnitude and powers
+_DERIVED_ATTRIBUTES = ('_hash', '_inv_powers', '_scale', '_inverse_scale', '_standard_scale', '_from_standard_scale')
+
 
 class UnitType(BaseType):
     """
@@ -48,7 +53,8 @@ class UnitType(BaseType):
 class MetaUnit(type):
     """
     Metaclass to ensure that all subclasses of :class:`Unit` take the magnitude into account
-    when converting to standard units.
+    when converting to standard units. The factors for the magnitude are calculated once for each
+    instance, so the wrapped methods only need a multiplication.
     """
 
     def __new__(mcs, name, bases, attrs):
@@ -58,7 +64,7 @@ class MetaUnit(type):
             sub_convert_to_standard = getattr(cls, 'convert_value_to_standard')
 
             def new_convert_to_standard(self, value):
-                val = value * 10 ** (self.magnitude + self.base_magnitude)
+                val = value * self._scale
                 return sub_convert_to_standard(self, val)
             setattr(cls, 'convert_value_to_standard', new_convert_to_standard)
 
@@ -66,7 +72,7 @@ class MetaUnit(type):
             sub_convert_from_standard = getattr(cls, 'convert_value_from_standard')
 
             def new_convert_from_standard(self, value):
-                val = value * 10**(-1 * (self.magnitude + self.base_magnitude))
+                val = value * self._inverse_scale
                 return sub_convert_from_standard(self, val)
             setattr(cls, 'convert_value_from_standard', new_convert_from_standard)
 
@@ -74,7 +80,7 @@ class MetaUnit(type):
             sub_convert_err_to_standard = getattr(cls, 'convert_error_to_standard')
 
             def new_convert_err_to_standard(self, value):
-                val = value * 10**(self.magnitude + self.base_magnitude)
+                val = value * self._scale
                 return sub_convert_err_to_standard(self, val)
             setattr(cls, 'convert_error_to_standard', new_convert_err_to_standard)
 
@@ -82,7 +88,7 @@ class MetaUnit(type):
             sub_convert_err_from_standard = getattr(cls, 'convert_error_from_standard')
 
             def new_convert_err_from_standard(self, value):
-                val = value * 10**(-1 * (self.magnitude + self.base_magnitude))
+                val = value * self._inverse_scale
                 return sub_convert_err_from_standard(self, val)
             setattr(cls, 'convert_error_from_standard', new_convert_err_from_standard)
 
@@ -144,7 +150,11 @@ class Unit(object):
     the constituent units' standard untis
     """
 
+    __slots__ = ('_dimensions', '_magnitude', '_powers') + _DERIVED_ATTRIBUTES
+
     base_magnitude = 0.0
+    _normalised_cache = {}
+    _normalised_cache_size = 1024
     constituent_units = None
     """
     :class:`~chemdataextractor.model.units.unit.Unit` instance for showing constituent units.
@@ -164,9 +174,48 @@ class Unit(object):
         :param powers: (Optional) For representing any more complicated units, e.g. m/s may have this parameter set to {Meter():1.0, Second():-1.0}
         :type powers: dict[Unit : float]
         """
-        self.dimensions = dimensions
-        self.magnitude = magnitude
-        self.powers = powers
+        # Set directly, as a new unit has no derived attributes to discard
+        self._dimensions = dimensions
+        self._magnitude = magnitude
+        self._powers = powers
+
+    @property
+    def dimensions(self):
+        """The dimensions this unit is for, e.g. Temperature."""
+        return self._dimensions
+
+    @dimensions.setter
+    def dimensions(self, value):
+        self._dimensions = value
+        self._clear_derived()
+
+    @property
+    def magnitude(self):
+        """The magnitude of the unit, e.g. km would be meters with a magnitude of 3."""
+        return self._magnitude
+
+    @magnitude.setter
+    def magnitude(self, value):
+        self._magnitude = value
+        self._clear_derived()
+
+    @property
+    def powers(self):
+        """The powers of the units making up this unit, e.g. {Meter():1.0, Second():-1.0} for m/s."""
+        return self._powers
+
+    @powers.setter
+    def powers(self, value):
+        self._powers = value
+        self._clear_derived()
+
+    def _clear_derived(self):
+        """Discard the attributes derived from the dimensions, magnitude and powers, so they are recalculated."""
+        for key in _DERIVED_ATTRIBUTES:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                pass
 
     def convert_value_to_standard(self, value):
         """
@@ -175,8 +224,13 @@ class Unit(object):
 
         :param float value: The value to convert to standard units
         """
-        for unit, power in six.iteritems(self.powers):
-            value = unit.convert_value_to_standard(value**(1 / power))**power
+        if self._inv_powers is None:
+            raise AttributeError("%s has no powers, so it must implement convert_value_to_standard" % type(self).__name__)
+        for unit, power, inverse_power in self._inv_powers:
+            if power == 1.0:
+                value = unit.convert_value_to_standard(value)
+            else:
+                value = unit.convert_value_to_standard(value**inverse_power)**power
         return value
 
     def convert_value_from_standard(self, value):
@@ -186,8 +240,13 @@ class Unit(object):
 
         :param float value: The value to convert from standard units
         """
-        for unit, power in six.iteritems(self.powers):
-            value = unit.convert_value_from_standard(value**(1 / power))**power
+        if self._inv_powers is None:
+            raise AttributeError("%s has no powers, so it must implement convert_value_from_standard" % type(self).__name__)
+        for unit, power, inverse_power in self._inv_powers:
+            if power == 1.0:
+                value = unit.convert_value_from_standard(value)
+            else:
+                value = unit.convert_value_from_standard(value**inverse_power)**power
         return value
 
     def convert_error_to_standard(self, error):
@@ -199,8 +258,13 @@ class Unit(object):
         :return float error: The error converted to standard units:
         """
 
-        for unit, power in six.iteritems(self.powers):
-            error = unit.convert_error_to_standard(error**(1 / power))**power
+        if self._inv_powers is None:
+            raise AttributeError("%s has no powers, so it must implement convert_error_to_standard" % type(self).__name__)
+        for unit, power, inverse_power in self._inv_powers:
+            if power == 1.0:
+                error = unit.convert_error_to_standard(error)
+            else:
+                error = unit.convert_error_to_standard(error**inverse_power)**power
         return error
 
     def convert_error_from_standard(self, error):
@@ -212,11 +276,93 @@ class Unit(object):
         :return float error: The error converted from standard units:
         """
 
-        for unit, power in six.iteritems(self.powers):
-            error = unit.convert_error_from_standard(error**(1 / power))**power
+        if self._inv_powers is None:
+            raise AttributeError("%s has no powers, so it must implement convert_error_from_standard" % type(self).__name__)
+        for unit, power, inverse_power in self._inv_powers:
+            if power == 1.0:
+                error = unit.convert_error_from_standard(error)
+            else:
+                error = unit.convert_error_from_standard(error**inverse_power)**power
         return error
 
 
+    def convert_array_to_standard(self, values):
+        """
+        Converts an array of values from this unit to the standard value, usually the SI unit.
+        The conversion is applied to the whole array at once, so the unit is only traversed
+        once rather than once per value.
+
+        :param values: The values to convert to standard units
+        :type values: numpy.ndarray or list(float)
+        :return: The values converted to standard units
+        :rtype: numpy.ndarray
+        """
+        scale = self._standard_scale
+        if scale is not None:
+            return np.asarray(values, dtype=np.float64) * scale
+        return self._convert_array(self.convert_value_to_standard, values)
+
+    def convert_array_from_standard(self, values):
+        """
+        Converts an array of values to this unit from the standard value, usually the SI unit.
+        The conversion is applied to the whole array at once, so the unit is only traversed
+        once rather than once per value.
+
+        :param values: The values to convert from standard units
+        :type values: numpy.ndarray or list(float)
+        :return: The values converted from standard units
+        :rtype: numpy.ndarray
+        """
+        scale = self._from_standard_scale
+        if scale is not None:
+            return np.asarray(values, dtype=np.float64) * scale
+        return self._convert_array(self.convert_value_from_standard, values)
+
+    @staticmethod
+    def _get_scale(convert):
+        """
+        The factor applied by the given conversion if it is a pure scaling, e.g. for kilometers per hour,
+        so that whole arrays can be converted with a single multiplication. None if the conversion is
+        anything else, e.g. for Celsius.
+        The conversion is checked against a few positive values, as zero and negative values
+        cannot be converted by units with negative or fractional powers.
+        """
+        try:
+            unit_value = convert(1.0)
+            if unit_value and all(math.isclose(convert(value), value * unit_value)
+                                  for value in (2.0, 10.0)):
+                return float(unit_value)
+        except (ArithmeticError, TypeError, ValueError):
+            pass
+        return None
+
+    @staticmethod
+    def _convert_array(convert, values):
+        values = np.asarray(values, dtype=np.float64)
+        try:
+            return np.asarray(convert(values), dtype=np.float64)
+        except (TypeError, ValueError):
+            # Converters that only work on scalars, e.g. ones using the math module
+            return np.array([convert(value) for value in values.flat], dtype=np.float64).reshape(values.shape)
+
+    def _normalised(self):
+        """
+        A copy of this unit with a magnitude of 0, as used for the keys in powers.
+        These copies are cached and shared between units, so they should never be mutated.
+        At most ``_normalised_cache_size`` copies are kept, the oldest being discarded first.
+        """
+        key = (type(self), self.dimensions, frozenset(six.iteritems(self.powers)) if self.powers else None)
+        normalised = Unit._normalised_cache.get(key)
+        if normalised is None:
+            normalised = copy.copy(self)
+            normalised.magnitude = 0.0
+            if self.powers:
+                normalised.powers = dict(self.powers)
+            if len(Unit._normalised_cache) >= Unit._normalised_cache_size:
+                del Unit._normalised_cache[next(iter(Unit._normalised_cache))]
+            Unit._normalised_cache[key] = normalised
+        return normalised
+
     """
     Operators are implemented for the easy creation of complicated units out of
     simpler, fundamental units. This means that every combination of magnitudes
@@ -240,9 +386,7 @@ class Unit(object):
             for key, value in six.iteritems(self.powers):
                 powers[key] = self.powers[key] * other
         else:
-            new_key = copy.deepcopy(self)
-            new_key.magnitude = 0.0
-            powers[new_key] = other
+            powers[self._normalised()] = other
         return Unit(self.dimensions**other, powers=powers, magnitude=self.magnitude * other)
 
     def __mul__(self, other):
@@ -258,21 +402,17 @@ class Unit(object):
         if self.powers:
             for key, value in six.iteritems(self.powers):
                 powers[key] = self.powers[key]
-                normalised_key = copy.deepcopy(key)
-                normalised_key.magnitude = 0.0
-                normalised_values[normalised_key] = key.magnitude
+                normalised_values[key._normalised()] = key.magnitude
 
         else:
             if not isinstance(self, DimensionlessUnit):
-                new_key = copy.deepcopy(self)
-                new_key.magnitude = 0.0
+                new_key = self._normalised()
                 powers[new_key] = 1.0
                 normalised_values[new_key] = self.magnitude
 
         if other.powers:
             for key, value in six.iteritems(other.powers):
-                normalised_key = copy.deepcopy(key)
-                normalised_key.magnitude = 0.0
+                normalised_key = key._normalised()
                 if normalised_key in normalised_values.keys():
                     powers[key] += value
                     if powers[key] == 0:
@@ -282,8 +422,7 @@ class Unit(object):
 
         else:
             if not isinstance(other, DimensionlessUnit):
-                normalised_other = copy.deepcopy(other)
-                normalised_other.magnitude = 0.0
+                normalised_other = other._normalised()
                 if normalised_other in normalised_values:
                     powers[normalised_other] += 1.0
                     if powers[normalised_other] == 0:
@@ -299,33 +438,72 @@ class Unit(object):
     # eq and hash implemented so Units can be used as keys in dictionaries
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Unit):
             return False
+        # The cheap comparisons are done first so that the powers, which hold further units,
+        # are only compared when needed. Raising a unit without powers to the power of 1.0
+        # gives at most one power, so only do so if the other unit has exactly one power.
         if self.powers:
             if other.powers:
-                if self.powers == other.powers and self.magnitude == other.magnitude:
+                if self.magnitude == other.magnitude and self.powers == other.powers:
                     return True
             else:
-                if self.powers == (other**1.0).powers:
+                if len(self.powers) == 1 and self.powers == (other**1.0).powers:
                     return True
         elif other.powers:
-            if other.powers == (self**1.0).powers:
+            if len(other.powers) == 1 and other.powers == (self**1.0).powers:
                 return True
         else:
             if type(self) == type(other) and self.magnitude == other.magnitude and self.dimensions == other.dimensions:
                 return True
         return False
 
+    def __getattr__(self, key):
+        # The attributes derived from the dimensions, magnitude and powers are only calculated when
+        # first needed, so that creating a unit stays cheap. They are discarded whenever one of
+        # the defining attributes is set, see _clear_derived.
+        if key == '_hash':
+            # TODO: Should use the powers as part of the hash as well, but does not seem to work.
+            # Can't just hash the powers as units like Second() and Second()**1.0 compare equal even though only one of them has powers set. Better to have it this way, as it's okay for two hashes to clash.
+            self._hash = hash((type(self).__name__, self.dimensions, float(self.magnitude)))
+        elif key in ('_scale', '_inverse_scale'):
+            # The factors applied for the magnitude when converting values
+            total_magnitude = self.magnitude + self.base_magnitude
+            self._scale = 10**total_magnitude
+            self._inverse_scale = 10**(-1 * total_magnitude)
+        elif key == '_inv_powers':
+            # The inverse of each power for use when converting values. None for units without
+            # powers, which must implement the conversions themselves.
+            inv_powers = None
+            if self.powers:
+                inv_powers = tuple((unit, power, 1.0 / power if power else None)
+                                   for unit, power in six.iteritems(self.powers))
+            self._inv_powers = inv_powers
+        elif key == '_standard_scale':
+            # The conversions to and from standard units are not always exact inverses of each
+            # other, so the factor for each is found separately
+            self._standard_scale = self._get_scale(self.convert_value_to_standard)
+        elif key == '_from_standard_scale':
+            self._from_standard_scale = self._get_scale(self.convert_value_from_standard)
+        else:
+            raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, key))
+        return object.__getattribute__(self, key)
+
+    def __getstate__(self):
+        # Only the defining attributes are stored, the derived ones are recalculated when needed
+        state = dict(getattr(self, '__dict__', {}))
+        for key in ('dimensions', 'magnitude', 'powers'):
+            state[key] = getattr(self, key)
+        return state
+
+    def __setstate__(self, state):
+        for key, value in six.iteritems(state):
+            setattr(self, key, value)
+
     def __hash__(self):
-        string = str(self.__class__.__name__)
-        string += str(self.dimensions.__hash__())
-        string += str(float(self.magnitude))
-        # TODO: Should use the powers as part of the hash as well, but does not seem to work.
-        # Can't just hash the dictionary as that would lead to two units that are actually equal hashing to different values depending on the order in which the dictionary is iterated through, which is not neccesarily deterministic. Better to have it this way, as it's okay for two hashes to clash.
-        # if self.powers is not None:
-        #     for key in sorted(str(six.iteritems(self.powers))):
-        #         string += str(key)
-        return string.__hash__()
+        return self._hash
 
     def __str__(self):
         string = ''
@@ -346,13 +524,15 @@ class Unit(object):
 class DimensionlessUnit(Unit):
     """Special case to handle dimensionless quantities."""
 
+    __slots__ = ()
+
     def __init__(self, magnitude=0.0):
         """
         :param float magnitude: The magnitude of the unit.
         """
-        self.dimensions = Dimensionless()
-        self.magnitude = magnitude
-        self.powers = None
+        self._dimensions = Dimensionless()
+        self._magnitude = magnitude
+        self._powers = None
 
     def convert_to_standard(self, value):
         return value
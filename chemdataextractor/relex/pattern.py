@@ -10,13 +10,23 @@ Extraction pattern object
 """
 
 import re
+from functools import lru_cache
 from ..parse.elements import I, W, R, Any, And, Start, OneOrMore, Group
 from ..parse.actions import join
 
 
+@lru_cache(maxsize=4096)
+def _cached_I(token):
+    """Case-insensitive element for a single pattern token, shared between all patterns using that token"""
+    return I(token)
+
+
 class Pattern:
     """ Pattern object, fundamentally the same as a phrase except assigned a confidence"""
 
+    __slots__ = ('cluster_label', 'elements', 'entities', 'number_of_entities', '_middle_keys',
+                 'order', 'relations', 'confidence', 'parse_expression')
+
     def __init__(self, entities=None,
                  elements=None,
                  label=None,
@@ -27,60 +37,65 @@ class Pattern:
         self.elements = elements
         self.entities = entities
         self.number_of_entities = len(order)
+        self._middle_keys = tuple('middle_' + str(i+1) for i in range(self.number_of_entities - 1))
         self.order = order
         self.relations = relations
         self.confidence = confidence
-        self.parse_expression = self.generate_cde_parse_expression()
+        self.parse_expression = None
+        self.generate_cde_parse_expression()
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__ if hasattr(self, name)}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        # Patterns pickled before the keys were cached won't have them
+        self._middle_keys = tuple('middle_' + str(i+1) for i in range(self.number_of_entities - 1))
 
     def __repr__(self):
         return self.to_string()
     
     def to_string(self):
-        output_string = ''
-        output_string += ' '.join(self.elements['prefix']['tokens']) + ' '
-        if isinstance(self.entities[0].tag, tuple):
-            output_string += '(' + ', '.join([i for i in self.entities[0].tag]) + ') '
-        else:
-            output_string += '(' + self.entities[0].tag + ') '
-        for i in range(0, self.number_of_entities - 1):
-            output_string += ' '.join(self.elements['middle_' + str(i+1)]['tokens']) + ' '
-            if isinstance(self.entities[i+1].tag, tuple):
-                output_string += '(' + ', '.join([i for i in self.entities[i+1].tag]) + ') '
-            else:
-                output_string += '(' + self.entities[i+1].tag + ') '
-        output_string = output_string
-        output_string += ' '.join(self.elements['suffix']['tokens'])
-
-        return output_string
+        parts = [' '.join(self.elements['prefix']['tokens']), self._tag_string(self.entities[0])]
+        for i, middle_key in enumerate(self._middle_keys):
+            parts.append(' '.join(self.elements[middle_key]['tokens']))
+            parts.append(self._tag_string(self.entities[i+1]))
+        parts.append(' '.join(self.elements['suffix']['tokens']))
+        return ' '.join(parts)
+
+    @staticmethod
+    def _tag_string(entity):
+        if isinstance(entity.tag, tuple):
+            return '(' + ', '.join(entity.tag) + ')'
+        return '(' + entity.tag + ')'
+
     # TODO: Finish this once new parse_expressions are handled
 
     def generate_cde_parse_expression(self):
-        """Create a CDE parse expression for this extraction pattern
+        """Create a CDE parse expression for this extraction pattern.
+        The expression is only built once and is then kept as parse_expression, so set that to None
+        to rebuild it after changing the elements or entities.
         """
+        if self.parse_expression is not None:
+            return self.parse_expression
         elements = []
         prefix_tokens = self.elements['prefix']['tokens']
-        for token in prefix_tokens:
-            if token == '<Blank>':
-                continue
-            elements.append(I(token))
+        elements.extend(_cached_I(token) for token in prefix_tokens if token != '<Blank>')
 
         elements.append(self.entities[0].parse_expression)
         
-        for middle in range(0, self.number_of_entities -1):
-            middle_tokens = self.elements['middle_' + str(middle+1)]['tokens']
-            for token in middle_tokens:
-                if token == '<Blank>':
-                    continue
-                elements.append(I(token))
+        for middle, middle_key in enumerate(self._middle_keys):
+            middle_tokens = self.elements[middle_key]['tokens']
+            elements.extend(_cached_I(token) for token in middle_tokens if token != '<Blank>')
             elements.append(self.entities[middle+1].parse_expression)
 
         
         suffix_tokens = self.elements['suffix']['tokens']
-        for token in suffix_tokens:
-            if token == '<Blank>':
-                continue
-            elements.append(I(token))
+        elements.extend(_cached_I(token) for token in suffix_tokens if token != '<Blank>')
         
         final_phrase = And(exprs=elements)
-        parse_expression = (final_phrase)('phrase')
-        return parse_expression
+        # Named directly, as calling it to set the name would copy every element rather than share them
+        final_phrase.name = 'phrase'
+        self.parse_expression = final_phrase
+        return self.parse_expression
@@ -14,12 +14,12 @@ from __future__ import unicode_literals
 import logging
 import unittest
 
-from chemdataextractor.model import Compound, MeltingPoint, UvvisSpectrum, UvvisPeak, Apparatus, BaseModel
+from chemdataextractor.model import Compound, MeltingPoint, UvvisSpectrum, UvvisPeak, Apparatus, BaseModel, ModelList
 from chemdataextractor.model.units.temperature import TemperatureModel
 from chemdataextractor.parse.elements import I, W
 from chemdataextractor.model.base import StringType, ModelType, ListType, InferredProperty
 from chemdataextractor.doc.text import Sentence
-from chemdataextractor.parse.auto import AutoSentenceParser
+from chemdataextractor.parse.auto import AutoSentenceParser, AutoTableParser
 from chemdataextractor.doc import Document
 from lxml import etree
 logging.basicConfig(level=logging.DEBUG)
@@ -273,6 +273,78 @@ class TestModel(unittest.TestCase):
                            "inferred_from_nested": "4321"}}
         self.assertEqual(OuterModel.deserialize(expected).serialize(), outer_model.serialize())
 
+    def test_parsers_from_instance(self):
+        """Test parsers accessed from a model instance are the class's copies."""
+        class InstanceParsersModel(BaseModel):
+            parsers = [AutoSentenceParser()]
+
+        self.assertIs(InstanceParsersModel().parsers, InstanceParsersModel.parsers)
+        self.assertIs(InstanceParsersModel().parsers[0].model, InstanceParsersModel)
+
+    def test_parsers_subclass(self):
+        """Test parsers are copied for a subclass defined after the base class's parsers were used."""
+        class BaseParsersModel(BaseModel):
+            parsers = [AutoSentenceParser()]
+
+        self.assertIs(BaseParsersModel.parsers[0].model, BaseParsersModel)
+
+        class SubParsersModel(BaseParsersModel):
+            pass
+
+        self.assertIs(SubParsersModel().parsers[0].model, SubParsersModel)
+        self.assertIs(BaseParsersModel().parsers[0].model, BaseParsersModel)
+
+    def test_parsers_appended_subclass(self):
+        """Test a subclass inherits parsers appended to its base class before it was defined."""
+        class BaseParsersModel(BaseModel):
+            parsers = [AutoSentenceParser()]
+
+        BaseParsersModel.parsers.append(AutoTableParser())
+
+        class SubParsersModel(BaseParsersModel):
+            pass
+
+        self.assertEqual([type(p) for p in SubParsersModel.parsers], [AutoSentenceParser, AutoTableParser])
+        self.assertTrue(all(p.model is SubParsersModel for p in SubParsersModel.parsers))
+
+
+class TestModelList(unittest.TestCase):
+
+    def test_models(self):
+        """Test the models property gets and sets the contents of the ModelList."""
+        compound = Compound(names=['Coumarin 343'])
+        model_list = ModelList(compound)
+        self.assertIs(model_list.models, model_list)
+        self.assertEqual(model_list.models, [compound])
+        other_compound = Compound(labels=['3a'])
+        model_list.models = [other_compound]
+        self.assertEqual(len(model_list), 1)
+        self.assertIs(model_list[0], other_compound)
+
+    def test_append_extend(self):
+        """Test models can be added to a ModelList like a list."""
+        model_list = ModelList()
+        model_list.append(Compound(names=['Coumarin 343']))
+        model_list.extend([Compound(labels=['3a']), MeltingPoint(value=[240])])
+        self.assertEqual(len(model_list), 3)
+        self.assertIsInstance(model_list, ModelList)
+        self.assertEqual(model_list.models[2], MeltingPoint(value=[240]))
+
+    def test_serialize(self):
+        """Test ModelList serializes each of its models."""
+        model_list = ModelList(Compound(names=['Coumarin 343']), Compound(labels=['3a']))
+        expected = [{'Compound': {'names': ['Coumarin 343']}}, {'Compound': {'labels': ['3a']}}]
+        self.assertEqual(model_list.serialize(), expected)
+
+    def test_remove_subsets(self):
+        """Test remove_subsets leaves only the records that are not subsets of another."""
+        compound = Compound(names=['Coumarin 343'])
+        superset = Compound(names=['Coumarin 343'], labels=['3a'])
+        model_list = ModelList(compound, superset, Compound(names=['Coumarin 343']))
+        model_list.remove_subsets()
+        self.assertEqual(len(model_list), 1)
+        self.assertIs(model_list[0], superset)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -17,13 +17,14 @@ import six
 import logging
 import unittest
 import copy
+import pickle
 
 from chemdataextractor.model.units.quantity_model import QuantityModel, DimensionlessModel
 from chemdataextractor.model.units.dimension import Dimensionless, Dimension
 from chemdataextractor.model.units.unit import DimensionlessUnit, Unit
 
-from chemdataextractor.model.units.time import Second, Minute, Hour, Time, TimeModel
-from chemdataextractor.model.units.length import Meter, Mile, Length, LengthModel
+from chemdataextractor.model.units.time import Second, Minute, Hour, Year, Time, TimeModel
+from chemdataextractor.model.units.length import Meter, Mile, LengthUnit, Length, LengthModel
 from chemdataextractor.model.units.temperature import Temperature, TemperatureModel, Kelvin, Celsius, Fahrenheit
 from chemdataextractor.model.units.mass import Mass, Gram
 
@@ -111,6 +112,70 @@ class TestUnitClass(unittest.TestCase):
         standard_err = speed.convert_error_from_standard(26.8224)
         self.assertAlmostEqual(standard_err, 60., places)
 
+    def test_unit_convert_array_to_standard(self):
+        speed = Mile() / Hour()
+        standard_vals = speed.convert_array_to_standard([60.0, 120.0])
+        self.assertAlmostEqual(standard_vals[0], speed.convert_value_to_standard(60.0), places=places)
+        self.assertAlmostEqual(standard_vals[1], speed.convert_value_to_standard(120.0), places=places)
+
+    def test_unit_convert_array_to_standard_composite(self):
+        unit = Meter(magnitude=3.0) / Second() ** 2.0
+        standard_vals = unit.convert_array_to_standard([1.5, 4.0])
+        self.assertAlmostEqual(standard_vals[0], 1500.0, places=places)
+        self.assertAlmostEqual(standard_vals[1], 4000.0, places=places)
+        vals = unit.convert_array_from_standard(standard_vals)
+        self.assertAlmostEqual(vals[0], 1.5, places=places)
+        self.assertAlmostEqual(vals[1], 4.0, places=places)
+
+    def test_unit_convert_array_from_standard(self):
+        temp = Celsius()
+        vals = temp.convert_array_from_standard([400.0, 273.15])
+        self.assertAlmostEqual(vals[0], 126.85, places=places)
+        self.assertAlmostEqual(vals[1], 0.0, places=places)
+
+    def test_unit_convert_array_from_standard_composite(self):
+        for unit in [Mile(magnitude=-2.0) ** -1.0, Mile() * Kelvin(), Mile() ** 0.5]:
+            vals = unit.convert_array_from_standard([2.0, 50.0])
+            self.assertAlmostEqual(vals[0], unit.convert_value_from_standard(2.0), places=places)
+            self.assertAlmostEqual(vals[1], unit.convert_value_from_standard(50.0), places=places)
+
+    def test_unit_convert_without_conversion(self):
+        for unit in [Year(), LengthUnit(magnitude=3.0), DimensionlessUnit()]:
+            for convert in [unit.convert_value_to_standard, unit.convert_value_from_standard,
+                            unit.convert_error_to_standard, unit.convert_error_from_standard,
+                            unit.convert_array_to_standard, unit.convert_array_from_standard]:
+                with self.assertRaises(AttributeError) as context:
+                    convert(2.0)
+                self.assertIn(type(unit).__name__ + ' has no powers', str(context.exception))
+
+    def test_normalised_cache_size(self):
+        for power in range(Unit._normalised_cache_size + 10):
+            (Meter() ** (power + 2.0))._normalised()
+        self.assertLessEqual(len(Unit._normalised_cache), Unit._normalised_cache_size)
+        self.assertEqual((Meter(magnitude=3.0) ** 2.0).powers, {Meter(): 2.0})
+
+    def test_pickle_composite_unit(self):
+        unit = Mile(magnitude=3.0) * Kelvin() / Hour() ** 2.0
+        unpickled = pickle.loads(pickle.dumps(unit))
+        self.assertEqual(unpickled, unit)
+        self.assertEqual(hash(unpickled), hash(unit))
+        self.assertAlmostEqual(unpickled.convert_value_to_standard(60.0), unit.convert_value_to_standard(60.0), places=places)
+        self.assertAlmostEqual(unpickled.convert_value_from_standard(60.0), unit.convert_value_from_standard(60.0), places=places)
+        self.assertAlmostEqual(unpickled.convert_error_to_standard(6.0), unit.convert_error_to_standard(6.0), places=places)
+
+    def test_unit_changed_after_use(self):
+        unit = Meter()
+        self.assertAlmostEqual(unit.convert_value_to_standard(1.0), 1.0, places=places)
+        hash(unit)
+        unit.magnitude = 3.0
+        self.assertAlmostEqual(unit.convert_value_to_standard(1.0), 1000.0, places=places)
+        self.assertAlmostEqual(unit.convert_array_to_standard([1.0])[0], 1000.0, places=places)
+        self.assertEqual(hash(unit), hash(Meter(magnitude=3.0)))
+        speed = Mile() / Hour()
+        self.assertAlmostEqual(speed.convert_value_to_standard(3600.0), 1609.34, places=places)
+        speed.powers = {Meter(): 1.0, Second(): -1.0}
+        self.assertAlmostEqual(speed.convert_value_to_standard(3600.0), 3600.0, places=places)
+
     def test_dimensionless(self):
         dimensionless_div = Meter() / Meter()
         dimensionless = DimensionlessUnit()
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+
+Test relex Pattern
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+import logging
+import unittest
+
+from chemdataextractor.relex import Entity, Pattern
+from chemdataextractor.parse.elements import I
+
+
+logging.basicConfig(level=logging.DEBUG)
+log = logging.getLogger(__name__)
+
+
+class TestPattern(unittest.TestCase):
+
+    maxDiff = None
+
+    def make_pattern(self):
+        entities = [
+            Entity('this', 'who', I('this'), 0, 1),
+            Entity('phrase', 'what', I('phrase'), 4, 5)]
+        elements = {'prefix': {'tokens': ['<Blank>']},
+                    'middle_1': {'tokens': ['is', 'a', 'test']},
+                    'suffix': {'tokens': ['<Blank>']}}
+        return Pattern(entities=entities, elements=elements, order=[0, 1], relations=[], confidence=1.0)
+
+    def test_pattern_create(self):
+        """Test that Pattern objects are correctly created with their parse expression
+        """
+        pattern = self.make_pattern()
+        self.assertEqual(pattern.to_string(), '<Blank> (who) is a test (what) <Blank>')
+        self.assertIs(pattern.generate_cde_parse_expression(), pattern.parse_expression)
+        tokens = [('this', 'DT'), ('is', 'VBZ'), ('a', 'DT'), ('test', 'NN'), ('phrase', 'NN')]
+        results = [result for result in pattern.parse_expression.scan(tokens)]
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0][0].tag, 'phrase')
+
+    def test_pattern_rebuild(self):
+        """Test that the parse expression is rebuilt and kept after being reset
+        """
+        pattern = self.make_pattern()
+        pattern.elements['middle_1']['tokens'] = ['is', 'another', 'test']
+        pattern.parse_expression = None
+        parse_expression = pattern.generate_cde_parse_expression()
+        self.assertIs(pattern.parse_expression, parse_expression)
+        tokens = [('this', 'DT'), ('is', 'VBZ'), ('another', 'DT'), ('test', 'NN'), ('phrase', 'NN')]
+        results = [result for result in pattern.parse_expression.scan(tokens)]
+        self.assertEqual(len(results), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -128,6 +128,17 @@ class TestSnowball(unittest.TestCase):
               'value': [5.0]}}]
         self.assertDictEqual(expected[0], models[0])
 
+    def test_load(self):
+        """Test a saved Snowball instance loads with its patterns intact
+        """
+        loaded = Snowball.load('chemdataextractor/relex/data/CurieTemperature.pkl')
+        self.assertEqual(len(loaded.clusters), 1)
+        pattern = loaded.clusters[0].pattern
+        expected = ('The (curietemperature__specifier) for (compound__names) is (curietemperature__raw_value) '
+                    '<Blank> (curietemperature__raw_units) <Blank>')
+        self.assertEqual(pattern.to_string(), expected)
+        self.assertEqual(pattern.confidence, 0.75)
+
 
 
 